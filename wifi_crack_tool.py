@@ -4,7 +4,8 @@ Author: 白恒aead
 Repositories: https://github.com/baihengaead/wifi-crack-tool
 Version: 1.2.5
 """
-import os,sys,datetime,time,threading,ctypes,json
+import os,sys,datetime,time,threading,ctypes,json,queue,re,html
+from collections import deque
 import platform
 
 from pywifi import const,PyWiFi,Profile
@@ -12,9 +13,9 @@ from pywifi.iface import Interface
 
 import pyperclip
 
-from PySide6.QtCore import Qt, QThread, Signal, QSize
+from PySide6.QtCore import Qt, QThread, Signal, QSize, QAbstractListModel, QModelIndex, QTimer
 from PySide6.QtWidgets import QApplication, QMainWindow, QFileDialog, QWidget, QMessageBox
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QColor
 from wifi_crack_tool_gui import Ui_MainWindow
 
 class MainWindow(QMainWindow):
@@ -51,12 +52,28 @@ class MainWindow(QMainWindow):
         self.ui.btn_pause_or_resume.setDisabled(True)
         self.ui.btn_stop.setDisabled(True)
         
-        self.ui.txt_log_msg_info.setReadOnly(True)
-        self.log_end = self.ui.txt_log_msg_info.textCursor().MoveOperation.End
-        self.log_color = self.ui.txt_log_msg_info.textColor()
+        # 日志列表只保留最近的日志，完整日志见日志文件
+        self.log_model = MainWindow.LogListModel()
+        self.ui.lst_log_msg_info.setModel(self.log_model)
+        self.ui.lst_log_msg_info.setUniformItemSizes(True)
+        self.ui.lst_log_msg_info.setWordWrap(False)
         #======================================================================#
         
         self.tool = WifiCrackTool(self)
+        try:
+            log_view_max_lines = int(self.tool.config_settings_data.get('log_view_max_lines',5000))
+            if log_view_max_lines <= 0:
+                raise ValueError(log_view_max_lines)
+        except (TypeError,ValueError):
+            log_view_max_lines = 5000 # 配置无效时使用默认值
+        self.tool.config_settings_data['log_view_max_lines'] = log_view_max_lines
+        self.log_model.set_max_lines(log_view_max_lines)
+        
+        # 定时读取破解进度并刷新界面，避免每次尝试都发送信号
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(100)
+        self.progress_timer.timeout.connect(self.tool.update_progress)
+        self.progress_timer.start()
         #---------------------- 绑定事件 ---------------------------#
         self.ui.btn_change_pwd_file.clicked.connect(self.tool.change_pwd_file)
         self.ui.btn_refresh_wifi.clicked.connect(self.tool.refresh_wifi)
@@ -155,6 +172,51 @@ class MainWindow(QMainWindow):
         elif len(control) == 1:
             control[0].setEnabled(state)
         
+    class LogListModel(QAbstractListModel):
+        '''日志列表数据模型，最多保留 max_lines 行，超出时丢弃最早的日志'''
+        
+        def __init__(self,max_lines:int=5000):
+            super().__init__()
+            self.lines:deque[tuple[str,QColor]] = deque(maxlen=max_lines)
+        
+        def set_max_lines(self,max_lines:int):
+            '''设置最多保留的日志行数'''
+            self.beginResetModel()
+            self.lines = deque(self.lines,maxlen=max(1,max_lines))
+            self.endResetModel()
+        
+        def rowCount(self,parent=QModelIndex()):
+            return 0 if parent.isValid() else len(self.lines)
+        
+        def data(self,index,role=Qt.ItemDataRole.DisplayRole):
+            if not index.isValid():
+                return None
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.lines[index.row()][0]
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self.lines[index.row()][1]
+            return None
+        
+        def append(self,lines:list[tuple[str,QColor]]):
+            '''追加日志行'''
+            lines = lines[-self.lines.maxlen:] # type: ignore
+            overflow = len(self.lines)+len(lines)-self.lines.maxlen # type: ignore
+            if overflow > 0:
+                # 移除最早的日志行
+                self.beginRemoveRows(QModelIndex(),0,overflow-1)
+                for _ in range(overflow):
+                    self.lines.popleft()
+                self.endRemoveRows()
+            self.beginInsertRows(QModelIndex(),len(self.lines),len(self.lines)+len(lines)-1)
+            self.lines.extend(lines)
+            self.endInsertRows()
+        
+        def clear(self):
+            '''清空日志'''
+            self.beginResetModel()
+            self.lines.clear()
+            self.endResetModel()
+    
     class SignThread(QThread):
         """GUI信号线程"""
     
@@ -204,17 +266,26 @@ class WifiCrackTool:
         self.config_settings_data = {
             'scan_time':8,
             'connect_time':3,
-            'pwd_txt_path':'passwords.txt'
+            'pwd_txt_path':'passwords.txt',
+            'log_attempts':False,
+            'log_view_max_lines':5000
         }
         if os.path.exists(self.config_file_path):
             with open(self.config_file_path, 'r',encoding='utf-8') as config_file:
-                self.config_settings_data = json.load(config_file)
+                # 以默认配置为基础合并，使新增的配置项也会被保存
+                self.config_settings_data = {**self.config_settings_data,**json.load(config_file)}
                 self.ui.dbl_scan_time.setValue(self.config_settings_data['scan_time'])
                 self.ui.dbl_connect_time.setValue(self.config_settings_data['connect_time'])
         else:
             with open(self.config_file_path, 'w',encoding='utf-8') as config_file:
                 json.dump(self.config_settings_data, config_file, indent=4)
         
+        # 是否记录每次尝试的日志（关闭后仅记录关键信息）
+        self.log_attempts:bool = self.config_settings_data.get('log_attempts',False)
+        
+        # 创建后台日志写入对象
+        self.log_writer = self.LogWriter(self.log_dir_path)
+        
         pwd_txt_paths = self.config_settings_data['pwd_txt_path'].split('/')
         self.pwd_txt_name = pwd_txt_paths[len(pwd_txt_paths)-1]
         
@@ -232,6 +303,11 @@ class WifiCrackTool:
         self.run = False
         self.pwd_file_changed = False
         
+        # 破解进度
+        self.progress = self.CrackProgress()
+        self.progress_shown:tuple|None = None
+        '''运行结束后已显示的最终进度'''
+        
         # 创建破解对象
         self.crack = self.Crack(self)
         
@@ -281,16 +357,50 @@ class WifiCrackTool:
     def show_msg(self,msg:str,color:str="black"):
         '''显示日志消息'''
         dt = datetime.datetime.now()
-        with open(f"{self.log_dir_path}/wifi_crack_log_{dt.strftime('%Y%m%d')}.txt","a",encoding='utf-8') as log:
-            log.write(dt.strftime('%Y-%m-%d %H:%M:%S')+" >> "+msg)#输出日志到本地文件
-        self.ui.txt_log_msg_info.moveCursor(self.win.log_end)
-        self.ui.txt_log_msg_info.insertHtml("<span style='color:"+color+";'>"+dt.strftime('%Y-%m-%d %H:%M:%S')+" >> "+msg.replace('\n', '<br/>')+"</span><br/>")
-        self.ui.txt_log_msg_info.moveCursor(self.win.log_end)
+        self.log_writer.write(dt,msg)#输出日志到本地文件（由后台线程写入）
+        lines = []
+        for i,line in enumerate(msg.rstrip('\n').split('\n')):
+            # 日志列表不渲染HTML，取出行内颜色后去除标签
+            line_color = re.search(r"color:\s*([#\w]+)",line)
+            text = html.unescape(re.sub(r"<[^>]+>","",line))
+            prefix = dt.strftime('%Y-%m-%d %H:%M:%S')+" >> " if i == 0 else ""
+            lines.append((prefix+text,QColor(line_color.group(1) if line_color else color)))
+        bar = self.ui.lst_log_msg_info.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum()
+        self.win.log_model.append(lines)
+        if at_bottom:
+            self.ui.lst_log_msg_info.scrollToBottom()
 
+    # 刷新破解进度
+    def update_progress(self):
+        '''刷新进度条与速度显示'''
+        p = self.progress
+        if p.ssid == "":
+            return
+        snapshot = (p.ssid,p.index,p.total,tuple(p.ssid_status.items()))
+        if not p.running and snapshot == self.progress_shown:
+            return # 运行结束后不再刷新，保持最终结果
+        self.progress_shown = snapshot if not p.running else None
+        if p.total > 0:
+            self.ui.pgb_crack_progress.setRange(0,p.total)
+            self.ui.pgb_crack_progress.setValue(min(p.index,p.total))
+        elif p.running:
+            self.ui.pgb_crack_progress.setRange(0,0) # 总数未知时显示忙碌状态
+        else:
+            self.ui.pgb_crack_progress.setRange(0,1)
+            self.ui.pgb_crack_progress.setValue(0)
+        self.ui.pgb_crack_progress.setFormat(f"{p.ssid} %v/%m")
+        rate = p.rate()
+        eta = p.eta()
+        eta_text = str(datetime.timedelta(seconds=int(eta))) if eta is not None and p.running else "--:--:--"
+        self.ui.lbl_crack_speed.setText(f"{rate:.2f}次/秒  剩余 {eta_text}")
+        if len(p.ssid_status) > 1:
+            self.ui.pgb_crack_progress.setToolTip('\n'.join(f"{ssid}: {status}" for ssid,status in list(p.ssid_status.items())))
+    
     # 清空日志消息
     def clear_msg(self):
         '''清空输出消息'''
-        self.ui.txt_log_msg_info.setPlainText("")
+        self.win.log_model.clear()
 
     # 重置所有控件状态
     def reset_controls_state(self):
@@ -307,6 +417,7 @@ class WifiCrackTool:
             self.ui.btn_pause_or_resume.setDisabled(True)
             self.ui.btn_stop.setDisabled(True)
             self.ui.btn_pause_or_resume.setText("暂停")
+            self.progress.stop()
             with self.crack_pause_condition:
                 self.paused = False
                 self.crack_pause_condition.notify_all()
@@ -365,6 +476,8 @@ class WifiCrackTool:
             if self.config_settings_data['pwd_txt_path']!="" and os.path.exists(self.config_settings_data['pwd_txt_path']):
                 wifi_name = self.ui.cbo_wifi_name.currentText()
                 self.run = True
+                self.progress.reset()
+                self.ui.pgb_crack_progress.setToolTip("")
                 self.set_controls_running_state()
                 if self.ui.cbo_wifi_name.currentIndex() == 0:
                     thread = threading.Thread(target=self.crack.auto_crack)
@@ -388,11 +501,13 @@ class WifiCrackTool:
             with self.crack_pause_condition:
                 if self.paused:
                     self.paused = False
+                    self.progress.resume()
                     self.ui.btn_pause_or_resume.setText("暂停")
                     self.show_msg("开始继续破解...")
                     self.crack_pause_condition.notify_all()
                 else:
                     self.paused = True
+                    self.progress.pause()
                     self.ui.btn_pause_or_resume.setText("继续")
                     self.show_msg("正在尝试暂停破解...")
                     self.crack_pause_condition.notify_all()
@@ -401,10 +516,28 @@ class WifiCrackTool:
             self.show_msg('[错误]暂停过程中发生未知错误 %s\n\n' %(r),"red")
             self.reset_controls_state()
     
+    # 可被打断的等待
+    def wait(self,seconds:float,interrupt_on_pause:bool=False) -> bool:
+        '''
+        等待指定时间，终止破解（或暂停破解）时立即返回
+        :seconds 等待时间（秒）
+        :interrupt_on_pause 暂停时是否也立即返回
+        :return True->等待完成，False->被打断
+        '''
+        deadline = time.monotonic()+seconds
+        with self.crack_pause_condition:
+            while self.run and not (interrupt_on_pause and self.paused):
+                remaining = deadline-time.monotonic()
+                if remaining <= 0:
+                    return True
+                self.crack_pause_condition.wait(remaining)
+        return False
+    
     # 终止破解
     def stop(self):
         try:
             self.run = False
+            self.progress.stop()
             self.show_msg("正在尝试终止破解...")
             with self.crack_pause_condition:
                 self.paused = False
@@ -414,6 +547,163 @@ class WifiCrackTool:
             self.show_msg('[错误]停止过程中发生未知错误 %s\n\n' %(r),"red")
             self.reset_controls_state()
 
+    # 破解进度统计的类
+    class CrackProgress:
+        '''
+        破解进度统计\n
+        由破解线程直接更新计数，GUI线程定时读取，不需要跨线程发送信号
+        '''
+        def __init__(self,window_size:int=20):
+            '''
+            :window_size 计算尝试速度时使用的最近尝试次数
+            '''
+            self.window_size = window_size
+            self.reset()
+            self.running = False
+        
+        def reset(self):
+            '''重置进度'''
+            self.ssid = ""
+            '''正在破解的wifi名称'''
+            self.index = 0
+            '''当前wifi已尝试的次数'''
+            self.total = 0
+            '''当前wifi需要尝试的总次数，0表示未知'''
+            self.attempts = 0
+            '''本次运行已尝试的总次数'''
+            self.ssid_status:dict[str,str] = {}
+            '''每个wifi的破解状态'''
+            self.running = True
+            '''是否正在运行，停止后界面不再刷新进度'''
+            self.paused_time = 0.0
+            '''累计暂停时长（秒）'''
+            self.pause_start:float|None = None
+            self.begin_time = self.__clock()
+            self.attempt_times:deque[float] = deque(maxlen=self.window_size)
+            '''当前wifi最近几次尝试完成的时间（不含暂停时长）'''
+        
+        def __clock(self) -> float:
+            '''不含暂停时长的计时'''
+            return time.monotonic()-self.paused_time
+        
+        def begin(self,ssid:str,total:int=0):
+            '''开始破解wifi'''
+            self.index = 0
+            self.total = total
+            self.attempt_times = deque(maxlen=self.window_size)
+            self.begin_time = self.__clock()
+            self.ssid = ssid
+            self.ssid_status[ssid] = "破解中"
+        
+        def attempt(self):
+            '''记录一次尝试'''
+            self.attempt_times.append(self.__clock())
+            self.index += 1
+            self.attempts += 1
+        
+        def pause(self):
+            '''暂停计时'''
+            if self.pause_start is None:
+                self.pause_start = time.monotonic()
+        
+        def resume(self):
+            '''继续计时'''
+            if self.pause_start is not None:
+                self.paused_time += time.monotonic()-self.pause_start
+                self.pause_start = None
+        
+        def stop(self):
+            '''停止运行'''
+            self.resume()
+            self.running = False
+        
+        def finish(self,ssid:str,status:str):
+            '''记录wifi的破解结果'''
+            self.ssid_status[ssid] = status
+        
+        def rate(self) -> float:
+            '''当前wifi最近几次尝试的平均每秒尝试次数'''
+            times = list(self.attempt_times)
+            if len(times) == 0:
+                return 0.0
+            if len(times) == self.window_size:
+                count,elapsed = len(times)-1,times[-1]-times[0]
+            else:
+                count,elapsed = len(times),times[-1]-self.begin_time
+            return count/elapsed if count > 0 and elapsed > 0 else 0.0
+        
+        def eta(self) -> float|None:
+            '''当前wifi预计剩余时间（秒），无法估计时返回None'''
+            rate = self.rate()
+            if self.total <= 0 or rate <= 0:
+                return None
+            return max(self.total-self.index,0)/rate
+    
+    # 后台写入日志文件的类
+    class LogWriter:
+        '''后台日志写入类'''
+        def __init__(self,log_dir_path:str,max_size:int=10000,flush_interval:float=1.0):
+            '''
+            :log_dir_path 日志目录路径
+            :max_size 日志队列的最大长度，队列已满时丢弃新日志
+            :flush_interval 批量写入日志文件的间隔时间（秒）
+            '''
+            self.log_dir_path = log_dir_path
+            self.flush_interval = flush_interval
+            self.log_queue:queue.Queue = queue.Queue(max_size)
+            self.dropped = 0
+            '''因队列已满而丢弃的日志数量'''
+            self.dropped_lock = threading.Lock()
+            self.thread = threading.Thread(target=self.__run)
+            self.thread.daemon = True
+            self.thread.start()
+        
+        def write(self,dt:datetime.datetime,msg:str):
+            '''将日志放入队列，不会阻塞调用线程'''
+            try:
+                self.log_queue.put_nowait((dt,msg))
+            except queue.Full:
+                with self.dropped_lock:
+                    self.dropped += 1
+        
+        def close(self):
+            '''写入剩余日志并结束后台线程'''
+            if self.thread.is_alive():
+                self.log_queue.put(None)
+                self.thread.join()
+        
+        def __run(self):
+            running = True
+            while running:
+                records:list[tuple[datetime.datetime,str]] = []
+                try:
+                    record = self.log_queue.get(timeout=self.flush_interval)
+                    # 一次性取出队列中已有的日志，批量写入
+                    while record is not None:
+                        records.append(record)
+                        record = self.log_queue.get_nowait()
+                    running = False
+                except queue.Empty:
+                    pass
+                if records or self.dropped:
+                    self.__flush(records)
+        
+        def __flush(self,records:list[tuple[datetime.datetime,str]]):
+            '''按日期分文件写入日志'''
+            try:
+                with self.dropped_lock:
+                    dropped,self.dropped = self.dropped,0
+                if dropped:
+                    records.append((datetime.datetime.now(),f"[警告]日志队列已满，已丢弃{dropped}条日志\n"))
+                files:dict[str,list[str]] = {}
+                for dt,msg in records:
+                    files.setdefault(dt.strftime('%Y%m%d'),[]).append(dt.strftime('%Y-%m-%d %H:%M:%S')+" >> "+msg)
+                for day,lines in files.items():
+                    with open(f"{self.log_dir_path}/wifi_crack_log_{day}.txt","a",encoding='utf-8') as log:
+                        log.write(''.join(lines))
+            except Exception:
+                pass # 写入失败时丢弃本批日志，避免影响破解过程
+    
     # 暴力破解wifi密码的类
     class Crack:
         '''用于暴力破解wifi的类'''
@@ -508,21 +798,36 @@ class WifiCrackTool:
                 pwds = {}
                 colors = {}
                 for ssid in self.ssids:
+                    if self.tool.run==False: # * 已终止，跳过剩余的wifi
+                        pwds[ssid] = "已终止"
+                        colors[ssid] = "red"
+                        continue
                     pwd = self.crack(ssid)
                     if isinstance(pwd,str):
                         pwds[ssid] = pwd
                         colors[ssid] = "green"
+                        self.tool.progress.finish(ssid,"成功")
+                    elif self.tool.run==False: # * 破解该wifi时被终止
+                        pwds[ssid] = "已终止"
+                        colors[ssid] = "red"
+                        self.tool.progress.finish(ssid,"已终止")
                     else:
                         pwds[ssid] = "破解失败"
                         colors[ssid] = "red"
+                        self.tool.progress.finish(ssid,"失败")
                 
-                self.win.show_msg.send(f"自动破解已完成！\n","blue")
+                stopped = self.tool.run==False
+                if stopped:
+                    self.win.show_msg.send(f"自动破解已终止！\n","red")
+                else:
+                    self.win.show_msg.send(f"自动破解已完成！\n","blue")
                 crack_result_info = "结果如下：\n"
                 for i,ssid in enumerate(self.ssids,1):
                     crack_result_info = crack_result_info+f"<span style='color:{colors[ssid]}'>{('&nbsp;'*40)}({i}){('&nbsp;'*10)}{ssid}{('&nbsp;'*10)}{pwds[ssid]}</span>\n"
                 
                 self.win.show_msg.send(crack_result_info,"blue")
-                self.win.show_info.send('自动破解',"自动破解已完成！破解结果已记录到日志中")
+                if not stopped:
+                    self.win.show_info.send('自动破解',"自动破解已完成！破解结果已记录到日志中")
                 
                 self.is_auto = False
                 self.win.reset_controls_state.send()
@@ -541,31 +846,29 @@ class WifiCrackTool:
             try:
                 self.iface.disconnect()  # 断开所有连接
                 self.win.show_msg.send("正在断开现有连接...\n","black")
-                time.sleep(1)
+                if not self.tool.wait(1):
+                    self.win.show_msg.send("破解已终止.\n","red")
+                    self.win.reset_controls_state.send()
+                    return False
                 if self.iface.status() in [const.IFACE_DISCONNECTED, const.IFACE_INACTIVE]:  # 测试是否已经断开网卡连接
                     self.win.show_msg.send("现有连接断开成功！\n\n","black")
                 else:
                     self.win.show_msg.send("[错误]现有连接断开失败！\n\n","red")
                     return False
                 self.win.show_msg.send(f"正在准备破解WiFi[{ssid}]...\n\n","black")
+                self.tool.progress.begin(ssid)
 
                 if len(self.tool.pwd_dict_data) > 0:
                     pwd_dict_list = [ssids for ssids in self.tool.pwd_dict_data if ssids['ssid'] == ssid]
                     if len(pwd_dict_list) > 0:
                         self.win.show_msg.send(f"发现密码字典中存在相同SSID：{ssid}，开始尝试破解...\n\n","black")
                         for i,pwd_dict in enumerate(pwd_dict_list,1):
-                            # * 暂停线程
-                            with self.tool.crack_pause_condition:
-                                if self.tool.paused:
-                                    self.win.show_msg.send("破解已暂停.\n","orange")
-                                    self.tool.crack_pause_condition.wait()
-                            # * 停止线程
-                            if self.tool.run==False:
-                                self.win.show_msg.send("破解已终止.\n","red")
-                                self.win.reset_controls_state.send()
-                                return False
                             pwd = pwd_dict['pwd']
-                            result = self.connect(ssid,pwd,'json',i)
+                            result = None
+                            while result is None: # * 尝试被暂停打断时，继续后重新尝试该密码
+                                if not self.__wait_if_paused():
+                                    return False
+                                result = self.connect(ssid,pwd,'json',i)
                             if result and not self.is_auto:
                                 self.win.show_info.send('破解成功',"连接成功，密码：%s\n(已复制到剪切板)"%(pwd))
                                 self.win.reset_controls_state.send()
@@ -574,20 +877,16 @@ class WifiCrackTool:
                                 return pwd
                         self.win.show_msg.send(f"已尝试完密码字典中[{ssid}]的所有密码，未成功破解\n\n","red")
                 self.win.show_msg.send(f"开始尝试使用密码本破解WiFi[{ssid}]...\n\n","black")
+                progress = self.tool.progress
+                progress.total = progress.index+self.__count_lines(self.tool.config_settings_data['pwd_txt_path'])
                 with open(self.tool.config_settings_data['pwd_txt_path'],'r', encoding='utf-8', errors='ignore') as lines:
                         for i,line in enumerate(lines,1):
-                            # * 暂停线程
-                            with self.tool.crack_pause_condition:
-                                if self.tool.paused:
-                                    self.win.show_msg.send("破解已暂停.\n","orange")
-                                    self.tool.crack_pause_condition.wait()
-                            # * 停止线程
-                            if self.tool.run==False:
-                                self.win.show_msg.send("破解已终止.\n","red")
-                                self.win.reset_controls_state.send()
-                                return False
                             pwd = line.strip()
-                            result = self.connect(ssid,pwd,'txt',i)
+                            result = None
+                            while result is None: # * 尝试被暂停打断时，继续后重新尝试该密码
+                                if not self.__wait_if_paused():
+                                    return False
+                                result = self.connect(ssid,pwd,'txt',i)
                             if result and not self.is_auto:
                                 self.win.show_info.send('破解成功',"连接成功，密码：%s\n(已复制到剪切板)"%(pwd))
                                 self.win.reset_controls_state.send()
@@ -604,6 +903,34 @@ class WifiCrackTool:
                 self.win.reset_controls_state.send()
                 return False
         
+        def __wait_if_paused(self) -> bool:
+            '''
+            暂停时等待继续
+            :return True->继续破解，False->破解已终止
+            '''
+            # * 暂停线程
+            with self.tool.crack_pause_condition:
+                if self.tool.paused:
+                    self.win.show_msg.send("破解已暂停.\n","orange")
+                while self.tool.paused and self.tool.run:
+                    self.tool.crack_pause_condition.wait()
+            # * 停止线程
+            if self.tool.run==False:
+                self.win.show_msg.send("破解已终止.\n","red")
+                self.win.reset_controls_state.send()
+                return False
+            return True
+        
+        def __count_lines(self,path:str) -> int:
+            '''统计密码本行数'''
+            count = 0
+            last = b'\n'
+            with open(path,'rb') as f:
+                for chunk in iter(lambda: f.read(1024*1024),b''):
+                    count += chunk.count(b'\n')
+                    last = chunk[-1:]
+            return count if last == b'\n' else count+1
+        
         def connect(self,ssid,pwd,filetype,count):
             '''
             连接wifi
@@ -611,6 +938,7 @@ class WifiCrackTool:
             :pwd wifi密码
             :filetype 密码本 txt / 密码字典 json
             :count 已尝试连接的次数
+            :return True->连接成功，False->连接失败，None->被暂停或终止打断
             '''
             try:
                 self.iface.disconnect()  # * 断开所有连接
@@ -641,9 +969,15 @@ class WifiCrackTool:
                 profile.key = pwd   # * type: ignore #WiFi密码
                 self.iface.remove_network_profile(profile)  # * 删除wifi文件
                 tem_profile = self.iface.add_network_profile(profile)   # * 添加新的WiFi文件
-                self.win.show_msg.send(f"正在进行第{count}次尝试...\n","black")
+                if self.tool.log_attempts:
+                    self.win.show_msg.send(f"正在进行第{count}次尝试...\n","black")
                 self.iface.connect(tem_profile) # * 连接
-                time.sleep(self.tool.config_settings_data['connect_time'])   # * 连接需要时间
+                if not self.tool.wait(self.tool.config_settings_data['connect_time'],interrupt_on_pause=True):   # * 连接需要时间
+                    # * 被暂停或终止打断，撤销本次尝试
+                    self.iface.disconnect()
+                    self.iface.remove_network_profile(profile)  # * 删除wifi文件
+                    return None
+                self.tool.progress.attempt()
                 if self.iface.status() == const.IFACE_CONNECTED:    # * 判断是否连接成功
                     self.win.show_msg.send(f"连接成功，密码：{pwd}\n\n","green")
                     pyperclip.copy(pwd); # * 将密码复制到剪切板
@@ -654,7 +988,8 @@ class WifiCrackTool:
                             json.dump(self.tool.pwd_dict_data, json_file, indent=4)
                     return True
                 else:
-                    self.win.show_msg.send(f"连接失败，密码是{pwd}\n\n","red")
+                    if self.tool.log_attempts:
+                        self.win.show_msg.send(f"连接失败，密码是{pwd}\n\n","red")
                     self.iface.remove_network_profile(profile)  # * 删除wifi文件
                     return False
 
@@ -734,6 +1069,9 @@ if __name__ == "__main__":
             
         sys.exit()
     finally:
+        # 写入剩余日志
+        if 'window' in vars():
+            window.tool.log_writer.close()
         if '__mutex' in vars():
             if __mutex is not None:
                 win32api.CloseHandle(__mutex)
@@ -16,8 +16,8 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QApplication, QComboBox, QDoubleSpinBox, QLabel,
-    QMainWindow, QPushButton, QSizePolicy, QSplitter,
-    QTextEdit, QWidget)
+    QListView, QMainWindow, QProgressBar, QPushButton,
+    QSizePolicy, QSplitter, QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -82,9 +82,16 @@ class Ui_MainWindow(object):
         self.lbl_using_pwd_file.setObjectName(u"lbl_using_pwd_file")
         self.lbl_using_pwd_file.setGeometry(QRect(5, 100, 521, 16))
         self.lbl_using_pwd_file.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.txt_log_msg_info = QTextEdit(self.centralwidget)
-        self.txt_log_msg_info.setObjectName(u"txt_log_msg_info")
-        self.txt_log_msg_info.setGeometry(QRect(0, 150, 529, 350))
+        self.lst_log_msg_info = QListView(self.centralwidget)
+        self.lst_log_msg_info.setObjectName(u"lst_log_msg_info")
+        self.lst_log_msg_info.setGeometry(QRect(0, 150, 529, 326))
+        self.pgb_crack_progress = QProgressBar(self.centralwidget)
+        self.pgb_crack_progress.setObjectName(u"pgb_crack_progress")
+        self.pgb_crack_progress.setGeometry(QRect(5, 479, 320, 18))
+        self.pgb_crack_progress.setValue(0)
+        self.lbl_crack_speed = QLabel(self.centralwidget)
+        self.lbl_crack_speed.setObjectName(u"lbl_crack_speed")
+        self.lbl_crack_speed.setGeometry(QRect(330, 479, 194, 18))
         self.lbl_scan_time = QLabel(self.centralwidget)
         self.lbl_scan_time.setObjectName(u"lbl_scan_time")
         self.lbl_scan_time.setGeometry(QRect(330, 10, 81, 20))
@@ -146,5 +153,6 @@ class Ui_MainWindow(object):
         self.btn_start.setText(QCoreApplication.translate("MainWindow", u"\u5f00\u59cb", None))
         self.btn_pause_or_resume.setText(QCoreApplication.translate("MainWindow", u"\u6682\u505c", None))
         self.btn_stop.setText(QCoreApplication.translate("MainWindow", u"\u505c\u6b62", None))
+        self.lbl_crack_speed.setText("")
     # retranslateUi
 